@@ -1,12 +1,12 @@
 from __future__ import annotations
 
-import linecache
 import re
+import sys
 import textwrap
 import typing
 from collections.abc import Mapping, Sequence
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, Union
 
 from gherkin.errors import CompositeParserException  # type: ignore
 from gherkin.parser import Parser  # type: ignore
@@ -55,38 +55,62 @@ ERROR_PATTERNS = [
     ),
 ]
 
+# All the ERROR_PATTERNS as a single alternation, so that each error line is scanned once.
+# Alternatives are tried in order, preserving the precedence of ERROR_PATTERNS.
+_ERROR_PATTERN = re.compile(
+    "|".join(f"(?P<e{i}>{pattern.pattern})" for i, (pattern, _, _) in enumerate(ERROR_PATTERNS))
+)
+_ERROR_BY_GROUP = {
+    f"e{i}": (exception_class, message) for i, (_, exception_class, message) in enumerate(ERROR_PATTERNS)
+}
 
-@dataclass
+# Slotted nodes save a ``__dict__`` per instance; ``slots`` is only accepted by ``dataclass`` on Python 3.10+.
+_DATACLASS_OPTIONS: dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# The ``from_dict`` constructors below pass fields positionally, in declaration order:
+# keyword argument binding in the generated ``__init__`` is a measurable share of
+# building the tree for large feature files.
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class Location:
     column: int
     line: int
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> Self:
-        return cls(column=data["column"], line=data["line"])
+        # Bypass the generated ``__init__``: a location is built for every node in the document.
+        location = object.__new__(cls)
+        location.column = data["column"]
+        location.line = data["line"]
+        return location
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Comment:
     location: Location
     text: str
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> Self:
-        return cls(location=Location.from_dict(data["location"]), text=data["text"])
+        return cls(Location.from_dict(data["location"]), data["text"])
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Cell:
     location: Location
     value: str
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> Self:
-        return cls(location=Location.from_dict(data["location"]), value=_to_raw_string(data["value"]))
+        # Bypass the generated ``__init__``, as for ``Location``: tables can hold many cells.
+        cell = object.__new__(cls)
+        cell.location = Location.from_dict(data["location"])
+        cell.value = _to_raw_string(data["value"])
+        return cell
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Row:
     id: str
     location: Location
@@ -95,47 +119,48 @@ class Row:
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> Self:
         return cls(
-            id=data["id"],
-            location=Location.from_dict(data["location"]),
-            cells=[Cell.from_dict(cell) for cell in data["cells"]],
+            data["id"],
+            Location.from_dict(data["location"]),
+            [Cell.from_dict(cell) for cell in data["cells"]],
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ExamplesTable:
     location: Location
     tags: list[Tag]
     name: str | None = None
     table_header: Row | None = None
-    table_body: list[Row] | None = field(default_factory=list)
+    table_body: list[Row] | None = None
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> Self:
+        tags = data["tags"]
+        table_header = data.get("tableHeader")
+        table_body = data.get("tableBody")
         return cls(
-            location=Location.from_dict(data["location"]),
-            name=data.get("name"),
-            table_header=Row.from_dict(data["tableHeader"]) if data.get("tableHeader") else None,
-            table_body=[Row.from_dict(row) for row in data.get("tableBody", [])],
-            tags=[Tag.from_dict(tag) for tag in data["tags"]],
+            Location.from_dict(data["location"]),
+            [Tag.from_dict(tag) for tag in tags] if tags else [],
+            data.get("name"),
+            Row.from_dict(table_header) if table_header else None,
+            [Row.from_dict(row) for row in table_body] if table_body else None,
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class DataTable:
     location: Location
     rows: list[Row]
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> Self:
-        return cls(
-            location=Location.from_dict(data["location"]), rows=[Row.from_dict(row) for row in data.get("rows", [])]
-        )
+        return cls(Location.from_dict(data["location"]), [Row.from_dict(row) for row in data.get("rows", [])])
 
     def raw(self) -> Sequence[Sequence[object]]:
         return [[cell.value for cell in row.cells] for row in self.rows]
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class DocString:
     content: str
     delimiter: str
@@ -144,13 +169,13 @@ class DocString:
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> Self:
         return cls(
-            content=textwrap.dedent(data["content"]),
-            delimiter=data["delimiter"],
-            location=Location.from_dict(data["location"]),
+            _dedent(data["content"]),
+            data["delimiter"],
+            Location.from_dict(data["location"]),
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Step:
     id: str
     location: Location
@@ -162,18 +187,21 @@ class Step:
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> Self:
+        datatable = data.get("dataTable")
+        docstring = data.get("docString")
         return cls(
-            id=data["id"],
-            location=Location.from_dict(data["location"]),
-            keyword=data["keyword"].strip(),
-            keyword_type=data["keywordType"],
-            text=data["text"],
-            datatable=DataTable.from_dict(data["dataTable"]) if data.get("dataTable") else None,
-            docstring=DocString.from_dict(data["docString"]) if data.get("docString") else None,
+            data["id"],
+            Location.from_dict(data["location"]),
+            # Step keywords and keyword types come from a handful of values; intern them to share one copy.
+            sys.intern(data["keyword"].strip()),
+            sys.intern(data["keywordType"]),
+            data["text"],
+            DataTable.from_dict(datatable) if datatable else None,
+            DocString.from_dict(docstring) if docstring else None,
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Tag:
     id: str
     location: Location
@@ -181,10 +209,10 @@ class Tag:
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> Self:
-        return cls(id=data["id"], location=Location.from_dict(data["location"]), name=data["name"])
+        return cls(data["id"], Location.from_dict(data["location"]), sys.intern(data["name"]))
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Scenario:
     id: str
     location: Location
@@ -197,19 +225,21 @@ class Scenario:
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> Self:
+        tags = data["tags"]
+        examples = data["examples"]
         return cls(
-            id=data["id"],
-            location=Location.from_dict(data["location"]),
-            keyword=data["keyword"],
-            name=data["name"],
-            description=data["description"],
-            steps=[Step.from_dict(step) for step in data["steps"]],
-            tags=[Tag.from_dict(tag) for tag in data["tags"]],
-            examples=[ExamplesTable.from_dict(example) for example in data["examples"]],
+            data["id"],
+            Location.from_dict(data["location"]),
+            sys.intern(data["keyword"]),
+            data["name"],
+            data["description"],
+            [Step.from_dict(step) for step in data["steps"]],
+            [Tag.from_dict(tag) for tag in tags] if tags else [],
+            [ExamplesTable.from_dict(example) for example in examples] if examples else [],
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Rule:
     id: str
     location: Location
@@ -221,18 +251,19 @@ class Rule:
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> Self:
+        tags = data["tags"]
         return cls(
-            id=data["id"],
-            location=Location.from_dict(data["location"]),
-            keyword=data["keyword"],
-            name=data["name"],
-            description=data["description"],
-            tags=[Tag.from_dict(tag) for tag in data["tags"]],
-            children=[Child.from_dict(child) for child in data["children"]],
+            data["id"],
+            Location.from_dict(data["location"]),
+            sys.intern(data["keyword"]),
+            data["name"],
+            data["description"],
+            [Tag.from_dict(tag) for tag in tags] if tags else [],
+            [_child_from_dict(child) for child in data["children"]],
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Background:
     id: str
     location: Location
@@ -244,31 +275,30 @@ class Background:
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> Self:
         return cls(
-            id=data["id"],
-            location=Location.from_dict(data["location"]),
-            keyword=data["keyword"],
-            name=data["name"],
-            description=data["description"],
-            steps=[Step.from_dict(step) for step in data["steps"]],
+            data["id"],
+            Location.from_dict(data["location"]),
+            sys.intern(data["keyword"]),
+            data["name"],
+            data["description"],
+            [Step.from_dict(step) for step in data["steps"]],
         )
 
 
-@dataclass
-class Child:
-    background: Background | None = None
-    rule: Rule | None = None
-    scenario: Scenario | None = None
+# A child node holds exactly one of these, so children are stored as the node itself.
+Child = Union[Background, Rule, Scenario]
 
-    @classmethod
-    def from_dict(cls, data: dict[str, Any]) -> Self:
-        return cls(
-            background=Background.from_dict(data["background"]) if data.get("background") else None,
-            rule=Rule.from_dict(data["rule"]) if data.get("rule") else None,
-            scenario=Scenario.from_dict(data["scenario"]) if data.get("scenario") else None,
-        )
 
+def _child_from_dict(data: dict[str, Any]) -> Child:
+    background = data.get("background")
+    if background:
+        return Background.from_dict(background)
+    rule = data.get("rule")
+    if rule:
+        return Rule.from_dict(rule)
+    return Scenario.from_dict(data["scenario"])
 
-@dataclass
+
+@dataclass(**_DATACLASS_OPTIONS)
 class Feature:
     location: Location
     language: str
@@ -280,34 +310,47 @@ class Feature:
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> Self:
+        tags = data["tags"]
         return cls(
-            location=Location.from_dict(data["location"]),
-            language=data["language"],
-            keyword=data["keyword"],
-            tags=[Tag.from_dict(tag) for tag in data["tags"]],
-            name=data["name"],
-            description=data["description"],
-            children=[Child.from_dict(child) for child in data["children"]],
+            Location.from_dict(data["location"]),
+            data["language"],
+            sys.intern(data["keyword"]),
+            [Tag.from_dict(tag) for tag in tags] if tags else [],
+            data["name"],
+            data["description"],
+            [_child_from_dict(child) for child in data["children"]],
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class GherkinDocument:
     feature: Feature
     comments: list[Comment]
 
     @classmethod
     def from_dict(cls, data: Mapping[str, Any]) -> Self:
+        comments = data["comments"]
         return cls(
-            feature=Feature.from_dict(data["feature"]),
-            comments=[Comment.from_dict(comment) for comment in data["comments"]],
+            Feature.from_dict(data["feature"]),
+            [Comment.from_dict(comment) for comment in comments] if comments else [],
         )
 
 
 def _to_raw_string(normal_string: str) -> str:
+    # Most cell values have no backslash; skip building a copy for those.
+    if "\\" not in normal_string:
+        return normal_string
     return normal_string.replace("\\", "\\\\")
 
 
+def _dedent(text: str) -> str:
+    # Gherkin already strips the doc string indentation, so usually no line starts with whitespace.
+    # In that case ``textwrap.dedent`` would return the text unchanged; avoid its regex scans.
+    if text[:1] not in (" ", "\t") and "\n " not in text and "\n\t" not in text:
+        return text
+    return textwrap.dedent(text)
+
+
 def get_gherkin_document(abs_filename: str, encoding: str = "utf-8") -> GherkinDocument:
     with open(abs_filename, encoding=encoding) as f:
         feature_file_text = f.read()
@@ -317,7 +360,9 @@ def get_gherkin_document(abs_filename: str, encoding: str = "utf-8") -> GherkinD
     except CompositeParserException as e:
         message = e.args[0]
         line = e.errors[0].location["line"]
-        line_content = linecache.getline(abs_filename, e.errors[0].location["line"]).rstrip("\n")
+        # The text is already in memory (and split on "\n", as gherkin numbers lines); no need to read the file again
+        feature_file_lines = feature_file_text.split("\n")
+        line_content = feature_file_lines[line - 1] if 0 < line <= len(feature_file_lines) else ""
         filename = abs_filename
         handle_gherkin_parser_error(message, line, line_content, filename, e)
         # If no patterns matched, raise a generic GherkinParserError
@@ -331,15 +376,13 @@ def handle_gherkin_parser_error(
     raw_error: str, line: int, line_content: str, filename: str, original_exception: Exception | None = None
 ) -> None:
     """Map the error message to a specific exception type and raise it."""
-    # Split the raw_error into individual lines
-    error_lines = raw_error.splitlines()
-
-    # Check each line against all error patterns
-    for error_line in error_lines:
-        for pattern, exception_class, message in ERROR_PATTERNS:
-            if pattern.search(error_line):
-                # If a match is found, raise the corresponding exception with the formatted message
-                if original_exception:
-                    raise exception_class(message, line, line_content, filename) from original_exception
-                else:
-                    raise exception_class(message, line, line_content, filename)
+    # The patterns never match across a newline, so a single search over the whole message
+    # finds the first error line that matches any of them.
+    match = _ERROR_PATTERN.search(raw_error)
+    if match:
+        # If a match is found, raise the corresponding exception with the formatted message
+        exception_class, message = _ERROR_BY_GROUP[typing.cast(str, match.lastgroup)]
+        if original_exception:
+            raise exception_class(message, line, line_content, filename) from original_exception
+        else:
+            raise exception_class(message, line, line_content, filename)
@@ -495,12 +495,12 @@ class FeatureParser:
         )
 
         for child in feature_data.children:
-            if child.background:
-                feature.background = self.parse_background(child.background)
-            elif child.rule:
-                self._parse_and_add_rule(child.rule, feature)
-            elif child.scenario:
-                self._parse_and_add_scenario(child.scenario, feature)
+            if isinstance(child, GherkinBackground):
+                feature.background = self.parse_background(child)
+            elif isinstance(child, GherkinRule):
+                self._parse_and_add_rule(child, feature)
+            elif isinstance(child, GherkinScenario):
+                self._parse_and_add_scenario(child, feature)
 
         return feature
 
@@ -522,8 +522,8 @@ class FeatureParser:
     def _extract_rule_background(self, rule_data: GherkinRule) -> Background | None:
         """Extract the first background from rule children if it exists."""
         for child in rule_data.children:
-            if child.background:
-                return self.parse_background(child.background)
+            if isinstance(child, GherkinBackground):
+                return self.parse_background(child)
         return None
 
     def _extract_rule_scenarios(
@@ -531,8 +531,8 @@ class FeatureParser:
     ) -> Generator[ScenarioTemplate]:
         """Yield each parsed scenario under a rule."""
         for child in rule_data.children:
-            if child.scenario:
-                yield self.parse_scenario(child.scenario, feature, rule)
+            if isinstance(child, GherkinScenario):
+                yield self.parse_scenario(child, feature, rule)
 
     def _parse_and_add_scenario(
         self, scenario_data: GherkinScenario, feature: Feature, rule: Rule | None = None
@@ -1,5 +1,10 @@
 import textwrap
 
+import pytest
+
+from pytest_bdd.exceptions import FeatureError, GherkinParseError
+from pytest_bdd.gherkin_parser import get_gherkin_document
+
 
 def test_multiple_features_error(pytester):
     """Test multiple features in a single feature file."""
@@ -251,3 +256,56 @@ def test_improper_initial_keyword(pytester):
     result.stdout.fnmatch_lines(
         ["*StepError: First step in a scenario or background must start with 'Given', 'When' or 'Then', but got And.*"]
     )
+
+
+def test_error_line_content(tmp_path):
+    """Test the line number and content reported for an error in the middle of the file."""
+    feature_file = tmp_path / "test.feature"
+    feature_file.write_text(
+        textwrap.dedent(
+            """\
+            Feature: First Feature
+                Scenario: First Scenario
+                    Given a step
+            Feature: Second Feature
+                Scenario: Second Scenario
+                    Given another step
+            """
+        ),
+        encoding="utf-8",
+    )
+
+    with pytest.raises(FeatureError) as exc_info:
+        get_gherkin_document(str(feature_file))
+
+    assert exc_info.value.line == 4
+    assert exc_info.value.line_content == "Feature: Second Feature"
+
+
+def test_error_line_content_crlf(tmp_path):
+    """Test the line content reported for a feature file with CRLF line endings."""
+    feature_file = tmp_path / "test.feature"
+    feature_file.write_bytes(
+        b"Feature: First Feature\r\n    Scenario: A scenario\r\n        Given a step\r\nFeature: Second Feature\r\n"
+    )
+
+    with pytest.raises(FeatureError) as exc_info:
+        get_gherkin_document(str(feature_file))
+
+    assert exc_info.value.line == 4
+    assert exc_info.value.line_content == "Feature: Second Feature"
+
+
+def test_error_line_content_at_eof(tmp_path):
+    """Test the line content reported for an error at the end of the file."""
+    feature_file = tmp_path / "test.feature"
+    feature_file.write_text(
+        'Feature: Unterminated doc string\n    Scenario: A scenario\n        Given a step\n            """\n            never closed\n',
+        encoding="utf-8",
+    )
+
+    with pytest.raises(GherkinParseError) as exc_info:
+        get_gherkin_document(str(feature_file))
+
+    assert exc_info.value.line == 6
+    assert exc_info.value.line_content == ""